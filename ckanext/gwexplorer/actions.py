@@ -1,15 +1,26 @@
+import json
 import logging
 import os
-from typing import Dict, List, Any
-import json
-
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Dict, Iterator, List, Any
+
+import ckan.model as model
 import ckan.plugins.toolkit as tk
-from psycopg2.extensions import adapt
+import orjson
+import pandas as pd
+from cachetools import LRUCache, TTLCache
+from sqlalchemy import create_engine, text
 from pygwalker.services.data_parsers import get_parser
 from pygwalker.data_parsers.database_parser import Connector
 from pygwalker.utils.encode import DataFrameEncoder
 
-COLUMNS_TO_EXCLUDE = ["_id", "id", "_full_text"]
+# Internal columns hidden from schema and data responses. frozenset for
+# O(1) membership on the per-field/per-row hot paths.
+COLUMNS_TO_EXCLUDE = frozenset({"_id", "id", "_full_text"})
 DEFAULT_POOL_SIZE = 15
 DEFAULT_MAX_OVERFLOW = 100
 DEFAULT_POOL_RECYCLE = 3600
@@ -40,12 +51,143 @@ DUCKDB_ENGINE_PARAMS = {
     }
 }
 
+# Parsers are the most expensive cached objects (each holds a sampled
+# example DataFrame of up to 1000 rows); bound the cache so a portal with
+# thousands of datastore resources can't grow it for the process lifetime.
+PARSER_CACHE_SIZE = 256
+
+# Field display labels change rarely (only on a schema/data-dictionary
+# edit), but resolving them costs a full datastore_search round trip. Cache
+# them briefly; resource update/delete hooks evict entries early.
+NAME_TITLE_CACHE_SIZE = 512
+NAME_TITLE_CACHE_TTL = 300
+
+# show_metadata output is deterministic until the resource schema changes,
+# so cache whole responses keyed by (resource_id, sort). Update/delete
+# hooks evict; the TTL covers schema changes made outside this process.
+METADATA_CACHE_SIZE = 1024
+METADATA_CACHE_TTL = 600
+
+# When a backend is down, every metadata call would otherwise retry the
+# full fetch and fail slowly, amplifying load exactly when the database
+# can least afford it. Remember failures for a few seconds and fail fast.
+FAILURE_CACHE_SIZE = 128
+FAILURE_CACHE_TTL = 5
+
+# Dashboards re-issue identical DSL queries as users pan and filter, so an
+# exact-match cache at the action boundary turns those repeats into a dict
+# lookup. Keyed on (resource_id, canonicalized payload). Resource hooks and
+# the chained datastore write actions evict via invalidate_resource; the
+# short TTL bounds staleness for writes this process never sees (another
+# web worker, direct SQL, or datastore not loaded).
+QUERY_CACHE_SIZE = 256
+QUERY_CACHE_TTL = 60
+
+# A granted resource_show authorization is stable over short windows, but
+# each check runs CKAN's full auth pipeline (user lookup, package fetch,
+# plugin auth functions). Remember positive results per (user, resource)
+# briefly; denials are never cached.
+AUTH_CACHE_SIZE = 1024
+AUTH_CACHE_TTL = 30
+
+# Engine parameters come from CKAN config, which is immutable once the
+# application has started; resolved lazily on first use and then reused
+# so the hot path skips the config lookups and type coercions.
+_engine_params = None
+
+# Truthy spellings accepted for the boolean-ish "sort" request parameter;
+# a set membership test instead of allocating a lowercased copy per call.
+_SORT_TRUE_VALUES = frozenset({True, "true", "True", "TRUE", "1", 1})
+
+# Resource IDs are UUIDs; reject anything else at the action boundary
+# before any database work is done.
+_VALID_RESOURCE_ID = re.compile(r"^[A-Za-z0-9_\-]+$")
+
 # Field-name fragments used to auto-detect geographic coordinate columns.
 LATITUDE_HINTS = ("latitude", "lat", "y")
 LONGITUDE_HINTS = ("longitude", "long", "lng", "lon", "x")
 
+# PostgreSQL data_type -> Graphic Walker field typing, for the
+# information_schema fast path. Mirrors what pygwalker infers from a
+# sampled DataFrame (numeric columns become measures because the parsers
+# are built with infer_number_to_dimension=False).
+_PG_QUANTITATIVE_TYPES = frozenset(
+    {
+        "smallint",
+        "integer",
+        "bigint",
+        "decimal",
+        "numeric",
+        "real",
+        "double precision",
+        "money",
+    }
+)
+_PG_TEMPORAL_TYPES = frozenset(
+    {
+        "date",
+        "timestamp without time zone",
+        "timestamp with time zone",
+        "time without time zone",
+        "time with time zone",
+    }
+)
+
+# Column names pygwalker treats as geographic coordinates (quantitative
+# dimension) regardless of their data type.
+_GEO_FIELD_NAMES = frozenset({"latitude", "longitude", "lat", "long", "lon"})
+
+# Shared SQLAlchemy engine for direct queries against the datastore read
+# URL (currently just the information_schema fast path).
+_read_engine = None
+_read_engine_lock = threading.Lock()
+
+# Parsers are expensive to build (engine construction plus schema
+# introspection round trips), so keep one per resource and reuse it across
+# requests, evicting least-recently-used entries past the bound. Guarded
+# by a lock because CKAN serves requests from multiple threads.
+_parser_cache: LRUCache = LRUCache(maxsize=PARSER_CACHE_SIZE)
+_parser_cache_lock = threading.Lock()
+
+# cachetools caches are not thread-safe, and these are hit from request
+# threads and _io_executor workers alike; every access goes through this
+# lock (held only for the dict operation itself, never across I/O).
+_cache_lock = threading.Lock()
+_name_title_cache: TTLCache = TTLCache(
+    maxsize=NAME_TITLE_CACHE_SIZE, ttl=NAME_TITLE_CACHE_TTL
+)
+_metadata_cache: TTLCache = TTLCache(
+    maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL
+)
+_auth_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL)
+_query_cache: TTLCache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL)
+_failure_cache: TTLCache = TTLCache(
+    maxsize=FAILURE_CACHE_SIZE, ttl=FAILURE_CACHE_TTL
+)
+
 log = logging.getLogger(__name__)
 
+# Shared pool for overlapping independent I/O calls (the GIL is released
+# during the underlying socket waits, so they genuinely run concurrently).
+_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gwexplorer")
+
+
+def _call_in_worker(func, *args):
+    """Run ``func`` on an executor thread, then drop its database session.
+
+    CKAN's ``model.Session`` is thread-scoped and is only cleaned up by the
+    web request teardown, which never runs on these long-lived workers. A
+    callable that touches CKAN actions would otherwise pin a session (and
+    its open transaction) per worker for the process lifetime, and the
+    session's identity map would keep serving stale resource rows across
+    requests. Removing the session in ``finally`` gives every submitted
+    call a fresh one.
+    """
+    try:
+        return func(*args)
+    finally:
+        model.Session.remove()
+
 
 class DSLQueryError(Exception):
     """Custom exception for DSL query errors."""
@@ -72,50 +214,119 @@ class DatabaseConnectionError(Exception):
     pass
 
 
-class DSLService:
+def _raw_field_from_column(name: str, data_type: str) -> Dict[str, str]:
+    """Build a Graphic Walker field descriptor from an information_schema row.
+
+    Reproduces the typing pygwalker's parser would infer for the same
+    column so the fast path and the parser path stay interchangeable.
     """
-    Service class for handling DSL (Domain Specific Language) operations.
+    if name.lower().strip(" .") in _GEO_FIELD_NAMES:
+        semantic, analytic = "quantitative", "dimension"
+    elif data_type in _PG_QUANTITATIVE_TYPES:
+        semantic, analytic = "quantitative", "measure"
+    elif data_type in _PG_TEMPORAL_TYPES:
+        semantic, analytic = "temporal", "dimension"
+    else:
+        semantic, analytic = "nominal", "dimension"
+
+    return {
+        "fid": name,
+        "name": name,
+        "semanticType": semantic,
+        "analyticType": analytic,
+    }
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a SQL identifier (PostgreSQL rules) for direct embedding."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+# One encoder instance reused for every value; its bound .default method is
+# the authoritative normalizer for types orjson cannot serialize natively.
+_encoder_default = DataFrameEncoder().default
+
+
+def _orjson_default(value: Any) -> Any:
+    """Normalize values orjson does not serialize natively.
 
-    This class encapsulates all database connection, metadata retrieval,
-    and data querying functionality for CKAN datastore table.
+    Datetimes are handled here (rather than by orjson's RFC 3339 output) to
+    keep the epoch-millisecond representation ``DataFrameEncoder`` has
+    always produced; everything else defers to the encoder itself.
     """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    return _encoder_default(value)
 
-    def __init__(self):
-        """Initialize the DSL service."""
-        self.columns_to_exclude = COLUMNS_TO_EXCLUDE
 
-    def _create_error_response(
-        self, field: str, message: str = "field required"
-    ) -> Dict[str, Any]:
-        """
-        Create a standardized error response.
+def _json_safe_rows(result: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalize a whole result set to JSON-safe rows in one C-level pass.
 
-        Args:
-            field: The field that caused the error
-            message: Error message
+    One orjson dumps/loads round trip (numpy handled natively, datetimes
+    and the rest routed through :func:`_orjson_default`, NaN emitted as
+    null) replaces a per-value Python coercion loop — far cheaper on large
+    result sets, and it leaves only native types for the stdlib encoder
+    CKAN applies to the final response.
+    """
+    return orjson.loads(
+        orjson.dumps(
+            result,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+            default=_orjson_default,
+        )
+    )
 
-        Returns:
-            Standardized error response dictionary
-        """
-        return {
-            "detail": [
-                {
-                    "loc": ["query", field],
-                    "msg": message,
-                    "type": "value_error.missing",
-                }
-            ]
-        }
 
-    def _get_database_connection_params(self) -> Dict[str, Any]:
-        """
-        Get database connection parameters from configuration.
+# ---------------------------------------------------------------------------
+# DSL service: database connection, metadata retrieval and data querying for
+# CKAN datastore tables. Plain module-level functions -- the only state is
+# the module-level caches above, and flat functions keep the hot paths free
+# of attribute lookups and make cache decoration/invalidation trivial.
+# ---------------------------------------------------------------------------
 
-        Returns:
-            Dictionary containing connection parameters
-        """
-        return {
-            "pool_size": tk.config.get("ckanext.odn.dsl.pool_size", DEFAULT_POOL_SIZE),
+
+def _create_error_response(
+    field: str, message: str = "field required"
+) -> Dict[str, Any]:
+    """
+    Create a standardized error response.
+
+    Args:
+        field: The field that caused the error
+        message: Error message
+
+    Returns:
+        Standardized error response dictionary
+    """
+    return {
+        "detail": [
+            {
+                "loc": ["query", field],
+                "msg": message,
+                "type": "value_error.missing",
+            }
+        ]
+    }
+
+
+def _get_database_connection_params() -> Dict[str, Any]:
+    """
+    Get database connection parameters from configuration.
+
+    Resolved once and cached for the process lifetime; CKAN config does
+    not change after startup.
+
+    Returns:
+        Dictionary containing connection parameters
+    """
+    global _engine_params
+    if _engine_params is None:
+        _engine_params = {
+            "pool_size": tk.config.get(
+                "ckanext.odn.dsl.pool_size", DEFAULT_POOL_SIZE
+            ),
             "max_overflow": tk.config.get(
                 "ckanext.odn.dsl.max_overflow", DEFAULT_MAX_OVERFLOW
             ),
@@ -124,323 +335,596 @@ class DSLService:
             ),
             "echo": tk.config.get("ckanext.odn.dsl.echo", False),
             "echo_pool": tk.config.get("ckanext.odn.dsl.echo_pool", False),
+            # The engine lives for the whole process now; detect connections
+            # Postgres dropped while they sat in the pool.
+            "pool_pre_ping": True,
         }
+    return _engine_params
 
-    def _get_table_parser(self, table_name: str) -> Any:
-        """
-        Create and return a table parser for the given resource.
 
-        The backend is chosen per resource: datastore-active resources are
-        queried over PostgreSQL (the datastore read URL), while non-datastore
-        resources are read straight from their uploaded file -- delimited
-        formats via an in-memory DuckDB, spreadsheets via pandas. This mirrors
-        the dual-mode logic in ``GwexplorerPlugin.can_view``.
+def _get_table_parser(table_name: str) -> Any:
+    """
+    Return the (cached) table parser for the given resource.
 
-        Args:
-            table_name: Resource ID to parse
+    Parsers are cached per resource so warm calls skip engine
+    construction and schema inference entirely; the cache is dropped
+    for a resource when it is updated or deleted (see
+    :func:`invalidate_resource`).
 
-        Returns:
-            Table parser object
+    Args:
+        table_name: Resource ID to parse
 
-        Raises:
-            DatabaseConnectionError: If a parser cannot be created
-        """
-        try:
-            resource = tk.get_action("resource_show")(
-                {"ignore_auth": True}, {"id": table_name}
-            )
+    Returns:
+        Table parser object
+
+    Raises:
+        DatabaseConnectionError: If a parser cannot be created
+    """
+    with _parser_cache_lock:
+        parser = _parser_cache.get(table_name)
+    if parser is not None:
+        return parser
 
-            if resource.get("datastore_active"):
-                return self._get_datastore_parser(table_name)
+    parser = _build_table_parser(table_name)
+    with _parser_cache_lock:
+        _parser_cache[table_name] = parser
+    return parser
 
-            return self._get_file_parser(resource)
-        except DatabaseConnectionError:
-            raise
-        except Exception as e:
-            log.error(f"Failed to create table parser for {table_name}: {e}")
-            raise DatabaseConnectionError(f"Database connection failed: {e}")
-
-    def _get_datastore_parser(self, table_name: str) -> Any:
-        """Build a parser backed by the PostgreSQL datastore table."""
-        read_url = tk.config.get("ckan.datastore.read_url", "")
-        if not read_url:
-            raise DatabaseConnectionError("Database read URL not configured")
-
-        conn = Connector(
-            read_url,
-            f'select * from "{adapt(table_name).adapted}"',
-            engine_params=self._get_database_connection_params(),
+
+def _build_table_parser(table_name: str) -> Any:
+    """
+    Create a table parser for the given resource.
+
+    The backend is chosen per resource: datastore-active resources are
+    queried over PostgreSQL (the datastore read URL), while non-datastore
+    resources are read straight from their uploaded file -- delimited
+    formats via an in-memory DuckDB, spreadsheets via pandas. This mirrors
+    the dual-mode logic in ``GwexplorerPlugin.can_view``.
+
+    Args:
+        table_name: Resource ID to parse
+
+    Returns:
+        Table parser object
+
+    Raises:
+        DatabaseConnectionError: If a parser cannot be created
+    """
+    try:
+        resource = tk.get_action("resource_show")(
+            {"ignore_auth": True}, {"id": table_name}
         )
 
-        return get_parser(
-            conn, infer_string_to_date=False, infer_number_to_dimension=False
+        if resource.get("datastore_active"):
+            return _get_datastore_parser(table_name)
+
+        return _get_file_parser(resource)
+    except DatabaseConnectionError:
+        raise
+    except Exception as e:
+        log.error(f"Failed to create table parser for {table_name}: {e}")
+        raise DatabaseConnectionError(f"Database connection failed: {e}")
+
+
+def _get_datastore_parser(table_name: str) -> Any:
+    """Build a parser backed by the PostgreSQL datastore table."""
+    read_url = tk.config.get("ckan.datastore.read_url", "")
+    if not read_url:
+        raise DatabaseConnectionError("Database read URL not configured")
+
+    # Project the exposed columns in SQL so internal ones (notably
+    # _full_text, often the widest column in the table) never leave
+    # Postgres instead of being dropped row-by-row in Python.
+    columns = _get_datastore_columns(table_name)
+    if columns:
+        select_list = ", ".join(_quote_identifier(c) for c in columns)
+    else:
+        select_list = "*"
+
+    # pygwalker's Connector keeps one engine per URL in a class-level map;
+    # seed it with the shared read engine so every datastore Connector (and
+    # the information_schema fast path) draws from a single deterministic
+    # pool with our settings, instead of whichever engine the first
+    # Connector happened to build.
+    Connector.engine_map.setdefault(read_url, _get_read_engine())
+
+    conn = Connector(
+        read_url,
+        f"select {select_list} from {_quote_identifier(table_name)}",
+        engine_params=_get_database_connection_params(),
+    )
+
+    return get_parser(
+        conn, infer_string_to_date=False, infer_number_to_dimension=False
+    )
+
+
+def _get_datastore_columns(table_name: str) -> List[str]:
+    """Return the datastore table's exposed column names, in order.
+
+    Internal columns are excluded here so the parser's view SQL never
+    selects them. Returns an empty list if the fields cannot be resolved,
+    in which case the caller falls back to ``select *``.
+    """
+    try:
+        result = tk.get_action("datastore_search")(
+            {"ignore_auth": True}, {"resource_id": table_name, "limit": 0}
         )
+    except Exception as e:
+        log.warning(f"Could not resolve columns for {table_name}: {e}")
+        return []
+
+    return [
+        field["id"]
+        for field in result.get("fields", [])
+        if field["id"] not in COLUMNS_TO_EXCLUDE
+    ]
+
+
+def _get_read_engine() -> Any:
+    """Return the shared SQLAlchemy engine for the datastore read URL."""
+    global _read_engine
+    with _read_engine_lock:
+        if _read_engine is None:
+            read_url = tk.config.get("ckan.datastore.read_url", "")
+            if not read_url:
+                raise DatabaseConnectionError(
+                    "Database read URL not configured"
+                )
+            engine = create_engine(
+                read_url, **_get_database_connection_params()
+            )
+            # Match what pygwalker's Connector does to its engines so
+            # column names come back unnormalized.
+            engine.dialect.requires_name_normalize = False
+            _read_engine = engine
+        return _read_engine
 
-    def _get_file_parser(self, resource: Dict[str, Any]) -> Any:
-        """Build a parser backed by a resource's data file (upload or remote)."""
-        fmt = self._resource_format(resource)
-        source = self._get_resource_source(resource)
 
-        if fmt in EXCEL_FORMATS:
-            return self._get_excel_parser(source, fmt)
-        if fmt in DUCKDB_FORMATS:
-            return self._get_duckdb_parser(source, fmt)
+def _get_raw_fields_fast(table_name: str) -> List[Dict[str, str]]:
+    """Read a datastore table's field descriptors from information_schema.
+
+    One query, versus the several round trips pygwalker's parser needs
+    to sample the table and infer types.
+    """
+    engine = _get_read_engine()
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                "SELECT column_name, data_type "
+                "FROM information_schema.columns "
+                "WHERE table_name = :table_name "
+                "ORDER BY ordinal_position"
+            ),
+            {"table_name": table_name},
+        ).fetchall()
 
+    if not rows:
         raise DatabaseConnectionError(
-            f"Unsupported file format for exploration: {fmt or 'unknown'}"
+            f"No datastore table found for {table_name}"
         )
 
-    def _get_duckdb_parser(self, source: str, fmt: str) -> Any:
-        """Build a parser that reads a delimited file via in-memory DuckDB.
+    return [_raw_field_from_column(row[0], row[1]) for row in rows]
 
-        ``source`` is either a local filesystem path (uploads) or an http(s)
-        URL (remote resources), which DuckDB reads in place via httpfs.
-        """
-        safe_source = source.replace("'", "''")
-        delim = DUCKDB_FORMATS.get(fmt)
-        if delim:
-            view_sql = f"SELECT * FROM read_csv_auto('{safe_source}', delim='{delim}')"
-        else:
-            view_sql = f"SELECT * FROM read_csv_auto('{safe_source}')"
 
-        conn = Connector(DUCKDB_URL, view_sql, engine_params=DUCKDB_ENGINE_PARAMS)
-        return get_parser(
-            conn, infer_string_to_date=False, infer_number_to_dimension=False
-        )
+def _get_raw_fields(table_name: str) -> List[Dict[str, str]]:
+    """Return Graphic Walker field descriptors for a resource.
+
+    Datastore tables take the single-query information_schema fast path;
+    metadata requests don't need the full parser. File-backed resources
+    still build the parser, which is the only thing that can type their
+    columns. Any fast-path failure falls back to the parser too.
+    """
+    resource = tk.get_action("resource_show")(
+        {"ignore_auth": True}, {"id": table_name}
+    )
+    if resource.get("datastore_active"):
+        try:
+            return _get_raw_fields_fast(table_name)
+        except Exception as e:
+            log.warning(
+                f"information_schema fast path failed for {table_name}: {e}"
+            )
+    return _get_table_parser(table_name).raw_fields
 
-    def _get_excel_parser(self, source: str, fmt: str) -> Any:
-        """Build a parser from a spreadsheet read into a pandas DataFrame.
 
-        ``source`` may be a local path (uploads) or an http(s) URL (remote);
-        pandas reads either. CKAN stores uploads without a file extension, so
-        the reader engine is selected from the resource format, not the source.
-        """
-        import pandas as pd
+def _get_file_parser(resource: Dict[str, Any]) -> Any:
+    """Build a parser backed by a resource's data file (upload or remote)."""
+    fmt = _resource_format(resource)
+    source = _get_resource_source(resource)
 
-        engine = "xlrd" if fmt == "xls" else "openpyxl"
-        df = pd.read_excel(source, engine=engine)
-        return get_parser(
-            df, infer_string_to_date=False, infer_number_to_dimension=False
+    if fmt in EXCEL_FORMATS:
+        return _get_excel_parser(source, fmt)
+    if fmt in DUCKDB_FORMATS:
+        return _get_duckdb_parser(source, fmt)
+
+    raise DatabaseConnectionError(
+        f"Unsupported file format for exploration: {fmt or 'unknown'}"
+    )
+
+
+def _get_duckdb_parser(source: str, fmt: str) -> Any:
+    """Build a parser that reads a delimited file via in-memory DuckDB.
+
+    ``source`` is either a local filesystem path (uploads) or an http(s)
+    URL (remote resources), which DuckDB reads in place via httpfs.
+    """
+    safe_source = source.replace("'", "''")
+    delim = DUCKDB_FORMATS.get(fmt)
+    if delim:
+        view_sql = f"SELECT * FROM read_csv_auto('{safe_source}', delim='{delim}')"
+    else:
+        view_sql = f"SELECT * FROM read_csv_auto('{safe_source}')"
+
+    conn = Connector(DUCKDB_URL, view_sql, engine_params=DUCKDB_ENGINE_PARAMS)
+    return get_parser(
+        conn, infer_string_to_date=False, infer_number_to_dimension=False
+    )
+
+
+def _get_excel_parser(source: str, fmt: str) -> Any:
+    """Build a parser from a spreadsheet read into a pandas DataFrame.
+
+    ``source`` may be a local path (uploads) or an http(s) URL (remote);
+    pandas reads either. CKAN stores uploads without a file extension, so
+    the reader engine is selected from the resource format, not the source.
+    """
+    engine = "xlrd" if fmt == "xls" else "openpyxl"
+    df = pd.read_excel(source, engine=engine)
+    return get_parser(
+        df, infer_string_to_date=False, infer_number_to_dimension=False
+    )
+
+
+def _resource_format(resource: Dict[str, Any]) -> str:
+    """Return the resource's lowercased format, falling back to the URL extension."""
+    from urllib.parse import urlparse
+
+    fmt = (resource.get("format") or "").strip().lower()
+    if fmt:
+        return fmt
+    # Use the URL path only, so a query string doesn't pollute the extension.
+    path = urlparse(resource.get("url") or "").path
+    return os.path.splitext(path)[1].lstrip(".").lower()
+
+
+def _get_resource_source(resource: Dict[str, Any]) -> str:
+    """Return a readable source for the resource's data file.
+
+    Uploaded resources resolve to their local path in CKAN storage; remote
+    resources return their URL, which DuckDB (via httpfs) and pandas read
+    in place -- no local copy is made.
+    """
+    if resource.get("url_type") == "upload":
+        from ckan.lib.uploader import get_resource_uploader
+
+        upload = get_resource_uploader(resource)
+        path = upload.get_path(resource["id"])
+        if path and os.path.exists(path):
+            return path
+        raise DatabaseConnectionError(
+            f"Uploaded file for resource {resource['id']} is not available "
+            "on disk"
         )
 
-    def _resource_format(self, resource: Dict[str, Any]) -> str:
-        """Return the resource's lowercased format, falling back to the URL extension."""
-        from urllib.parse import urlparse
-
-        fmt = (resource.get("format") or "").strip().lower()
-        if fmt:
-            return fmt
-        # Use the URL path only, so a query string doesn't pollute the extension.
-        path = urlparse(resource.get("url") or "").path
-        return os.path.splitext(path)[1].lstrip(".").lower()
-
-    def _get_resource_source(self, resource: Dict[str, Any]) -> str:
-        """Return a readable source for the resource's data file.
-
-        Uploaded resources resolve to their local path in CKAN storage; remote
-        resources return their URL, which DuckDB (via httpfs) and pandas read
-        in place -- no local copy is made.
-        """
-        if resource.get("url_type") == "upload":
-            from ckan.lib.uploader import get_resource_uploader
-
-            upload = get_resource_uploader(resource)
-            path = upload.get_path(resource["id"])
-            if path and os.path.exists(path):
-                return path
-            raise DatabaseConnectionError(
-                f"Uploaded file for resource {resource['id']} is not available "
-                "on disk"
-            )
+    url = resource.get("url")
+    if not url:
+        raise DatabaseConnectionError(
+            f"Resource {resource['id']} has no file to explore"
+        )
+    return url
 
-        url = resource.get("url")
-        if not url:
-            raise DatabaseConnectionError(
-                f"Resource {resource['id']} has no file to explore"
-            )
-        return url
 
-    def _get_name_title_map(self, table_name: str) -> Dict[str, str]:
-        """
-        Get mapping of field names to their display titles.
+def invalidate_resource(resource_id: str) -> None:
+    """
+    Drop cached state for a resource after its data or schema changed.
 
-        Args:
-            table_name: Name of the table
+    Called from ``GwexplorerPlugin``'s ``IResourceController`` hooks so a
+    stale parser is never used against a new table layout.
 
-        Returns:
-            Dictionary mapping field IDs to display names
-        """
-        try:
-            result = tk.get_action("datastore_search")(
-                {"ignore_auth": True}, {"resource_id": table_name, "limit": 0}
-            )
+    Args:
+        resource_id: Resource ID to evict
+    """
+    with _parser_cache_lock:
+        _parser_cache.pop(resource_id, None)
+    with _cache_lock:
+        _name_title_cache.pop(resource_id, None)
+        for sort in (False, True):
+            _metadata_cache.pop((resource_id, sort), None)
+        for key in [k for k in _query_cache if k[0] == resource_id]:
+            _query_cache.pop(key, None)
+        _failure_cache.pop(resource_id, None)
+
+
+def _get_name_title_map(table_name: str) -> Dict[str, str]:
+    """
+    Get mapping of field names to their display titles.
 
-            fields = result.get("fields", [])
-            name_map = {}
+    The map is resolved via ``datastore_search`` (the only place the
+    data-dictionary labels live) and memoized with a short TTL so
+    repeated metadata calls don't each pay for that round trip.
 
-            for field in fields:
-                field_id = field["id"]
-                if field_id not in self.columns_to_exclude:
-                    label = field.get("info", {}).get("label", field_id)
-                    name_map[field_id] = f"{label}"
+    Args:
+        table_name: Name of the table
 
-            return name_map
+    Returns:
+        Dictionary mapping field IDs to display names
+    """
+    with _cache_lock:
+        cached = _name_title_cache.get(table_name)
+    if cached is not None:
+        return cached
 
-        except Exception as e:
-            log.error(f"Error fetching name-title mapping for {table_name}: {e}")
-            return {}
-
-    def get_table_metadata(
-        self, table_name: str, sort: bool = False
-    ) -> List[Dict[str, Any]]:
-        """
-        Get metadata for a table including field information.
-
-        Args:
-            table_name: Name of the table
-            sort: Whether to sort fields by name
-
-        Returns:
-            List of field metadata dictionaries
-        """
-        try:
-            table_parser = self._get_table_parser(table_name)
-            name_title_map = self._get_name_title_map(table_name)
+    try:
+        result = tk.get_action("datastore_search")(
+            {"ignore_auth": True}, {"resource_id": table_name, "limit": 0}
+        )
+    except (KeyError, tk.ObjectNotFound):
+        # No labels to resolve: either the resource has no datastore table
+        # (file-backed), or the datastore plugin isn't loaded at all and
+        # tk.get_action raises KeyError. Field ids are used as names.
+        # Anything else (backend down, bad credentials) propagates.
+        with _cache_lock:
+            _name_title_cache[table_name] = {}
+        return {}
+
+    fields = result.get("fields", [])
+    name_map = {}
+
+    for field in fields:
+        field_id = field["id"]
+        if field_id not in COLUMNS_TO_EXCLUDE:
+            label = field.get("info", {}).get("label", field_id)
+            name_map[field_id] = f"{label}"
+
+    with _cache_lock:
+        _name_title_cache[table_name] = name_map
+    return name_map
+
+
+def get_table_metadata(
+    table_name: str, sort: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Get metadata for a table including field information.
 
-            result = table_parser.raw_fields
-            filtered_result = [
-                {**field, "name": name_title_map.get(field["fid"], field["fid"])}
-                for field in result
-                if field["fid"] not in self.columns_to_exclude
-            ]
+    Args:
+        table_name: Name of the table
+        sort: Whether to sort fields by name
 
-            if sort:
-                filtered_result = sorted(filtered_result, key=lambda x: x["name"])
+    Returns:
+        List of field metadata dictionaries
 
-            return filtered_result
+    Raises:
+        Exception: Whatever the schema or label fetch raised; callers build
+            the error response. A failure is remembered for a few seconds
+            so bursts of calls against a broken backend fail fast.
+    """
+    with _cache_lock:
+        cached_failure = _failure_cache.get(table_name)
+    if cached_failure is not None:
+        raise DatabaseConnectionError(cached_failure)
 
-        except Exception as e:
-            log.error(f"Error fetching table metadata for {table_name}: {e}")
-            return []
+    try:
+        # The schema fetch and the label lookup are independent I/O;
+        # overlap them so a cold metadata call pays for the slower of
+        # the two instead of their sum.
+        fields_future = _io_executor.submit(
+            _call_in_worker, _get_raw_fields, table_name
+        )
+        name_map_future = _io_executor.submit(
+            _call_in_worker, _get_name_title_map, table_name
+        )
+        result = fields_future.result()
+        name_title_map = name_map_future.result()
+        # Filter, copy and rename in one pass. dict(field, name=...) builds
+        # the copy in a single C-level call; the source dicts stay untouched
+        # because raw_fields may be cached on the parser.
+        visible = (
+            dict(field, name=name_title_map.get(field["fid"], field["fid"]))
+            for field in result
+            if field["fid"] not in COLUMNS_TO_EXCLUDE
+        )
+        if sort:
+            return sorted(visible, key=itemgetter("name"))
+        return list(visible)
+
+    except Exception as e:
+        # Propagate instead of returning [] — a silent empty schema made
+        # clients retry and hid the actual failure. Remember it briefly so
+        # the retries that do come fail without touching the backend.
+        with _cache_lock:
+            _failure_cache[table_name] = f"{e}"
+        log.error(f"Error fetching table metadata for {table_name}: {e}")
+        raise
+
+
+def get_data_from_payload(
+    table_name: str, payload: Dict[str, Any]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Get data from table using DSL payload.
 
-    def get_data_from_payload(
-        self, table_name: str, payload: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """
-        Get data from table using DSL payload.
+    Yields coerced rows one at a time so callers never hold both the raw
+    result set and its cleaned copy in memory at once. (CKAN actions must
+    still return a JSON-serializable dict, so ``query_data`` materializes
+    the rows exactly once at the action boundary.)
 
-        Args:
-            table_name: Name of the table
-            payload: DSL query payload
+    Args:
+        table_name: Name of the table
+        payload: DSL query payload
 
-        Returns:
-            List of data rows
+    Yields:
+        Data rows with internal columns removed and values JSON-safe
 
-        Raises:
-            DSLQueryError: If query execution fails
-        """
+    Raises:
+        DSLQueryError: If query execution fails
+    """
+    try:
+        table_parser = _get_table_parser(table_name)
         try:
-            table_parser = self._get_table_parser(table_name)
-            try:
-                result = table_parser.get_datas_by_payload(payload)
-            except Exception as e:
-                if "instance count too high" not in str(e):
-                    raise
-                log.warning(
-                    "gw_dsl_parser WASM store exhausted, resetting and retrying"
-                )
-                _reset_gw_dsl_parser()
-                result = table_parser.get_datas_by_payload(payload)
-
-            filtered_response = [
-                {
+            result = table_parser.get_datas_by_payload(payload)
+        except Exception as e:
+            if "instance count too high" not in str(e):
+                raise
+            log.warning(
+                "gw_dsl_parser WASM store exhausted, resetting and retrying"
+            )
+            _reset_gw_dsl_parser()
+            result = table_parser.get_datas_by_payload(payload)
+
+        # If the parser hands back a DataFrame, stay in pandas: column
+        # drop, value coercion and dict building all happen in the C
+        # layer instead of a Python loop per row. (pygwalker 0.4.8.8's
+        # own parsers return row dicts, so this is a guard for parsers
+        # that expose their internal frame directly.)
+        if isinstance(result, pd.DataFrame):
+            yield from _rows_from_dataframe(result)
+            return
+
+        rows = _json_safe_rows(result)
+
+        # Datastore-backed parsers already project internal columns out
+        # in SQL; only filter here when the backend actually returned
+        # some (e.g. an "id" column in an uploaded file).
+        drop = rows and {key for key in rows[0] if key in COLUMNS_TO_EXCLUDE}
+        if drop:
+            for row in rows:
+                yield {
                     key: value
                     for key, value in row.items()
-                    if key not in self.columns_to_exclude
+                    if key not in drop
                 }
-                for row in result
-            ]
+        else:
+            yield from rows
 
-            return json.loads(json.dumps(filtered_response, cls=DataFrameEncoder))
+    except Exception as e:
+        log.error(f"Error executing DSL query for {table_name}: {e}")
+        raise DSLQueryError(f"Query execution failed: {e}")
 
-        except Exception as e:
-            log.error(f"Error executing DSL query for {table_name}: {e}")
-            raise DSLQueryError(f"Query execution failed: {e}")
 
-    def show_metadata(self, resource_id: str, sort: bool = False) -> Dict[str, Any]:
-        """
-        Retrieve metadata for a table by its ID.
+def _rows_from_dataframe(df: "pd.DataFrame") -> List[Dict[str, Any]]:
+    """Convert a DataFrame result to JSON-safe rows without a Python loop.
 
-        Args:
-            resource_id: Resource ID
-            sort: Whether to sort fields by name
+    ``to_json`` emits datetimes as epoch milliseconds and NaN as null,
+    matching what ``_json_safe_rows`` produces on the row-dict path.
+    """
+    drop = [c for c in df.columns if c in COLUMNS_TO_EXCLUDE]
+    if drop:
+        df = df.drop(columns=drop)
+    return json.loads(
+        df.to_json(orient="records", date_format="epoch", date_unit="ms")
+    )
 
-        Returns:
-            Dictionary containing table metadata
-        """
-        if not resource_id:
-            return self._create_error_response("resourceID")
 
-        try:
-            fields_meta = self.get_table_metadata(resource_id, sort)
+def show_metadata(resource_id: str, sort: bool = False) -> Dict[str, Any]:
+    """
+    Retrieve metadata for a table by its ID.
 
-            return {
-                "success": True,
-                "schema": fields_meta,
-                "name": resource_id,
-                "resource_id": resource_id,
-                "message": "",
-            }
+    Args:
+        resource_id: Resource ID
+        sort: Whether to sort fields by name
 
-        except Exception as e:
-            log.error(f"Error in show_metadata for resource {resource_id}: {e}")
-            return {
-                "success": False,
-                "schema": [],
-                "name": resource_id,
-                "resource_id": resource_id,
-                "message": f"Error fetching metadata: {e}",
-            }
+    Returns:
+        Dictionary containing table metadata
+    """
+    if not resource_id:
+        return _create_error_response("resourceID")
 
-    def query_data(self, resource_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Query data from a table using DSL.
+    cache_key = (resource_id, sort)
+    with _cache_lock:
+        cached = _metadata_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-        Args:
-            resource_id: Resource ID
-            payload: DSL query payload
+    try:
+        fields_meta = get_table_metadata(resource_id, sort)
 
-        Returns:
-            Dictionary containing query results
-        """
-        if not resource_id:
-            return self._create_error_response("resourceID")
+        response = {
+            "success": True,
+            "schema": fields_meta,
+            "name": resource_id,
+            "resource_id": resource_id,
+            "message": "",
+        }
+        with _cache_lock:
+            _metadata_cache[cache_key] = response
+        return response
 
-        if not payload:
-            return self._create_error_response("payload", "payload field required")
+    except Exception as e:
+        log.error(f"Error in show_metadata for resource {resource_id}: {e}")
+        return {
+            "success": False,
+            "schema": [],
+            "name": resource_id,
+            "resource_id": resource_id,
+            "message": f"Error fetching metadata: {e}",
+        }
 
-        try:
-            data = self.get_data_from_payload(resource_id, payload)
 
+def query_data(resource_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Query data from a table using DSL.
+
+    Args:
+        resource_id: Resource ID
+        payload: DSL query payload
+
+    Returns:
+        Dictionary containing query results
+    """
+    if not resource_id:
+        return _create_error_response("resourceID")
+
+    if not payload:
+        return _create_error_response("payload", "payload field required")
+
+    try:
+        # Canonicalize the payload (sorted keys) so semantically identical
+        # queries share a cache entry regardless of key order.
+        cache_key = (
+            resource_id,
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS),
+        )
+    except TypeError:
+        cache_key = None
+
+    if cache_key is not None:
+        with _cache_lock:
+            data = _query_cache.get(cache_key)
+        if data is not None:
             return {
                 "success": True,
                 "data": data,
                 "message": "",
             }
 
-        except DSLQueryError as e:
-            return {
-                "success": False,
-                "data": None,
-                "message": str(e),
-            }
-        except Exception as e:
-            log.error(f"Unexpected error in query_data for resource {resource_id}: {e}")
-            return {
-                "success": False,
-                "data": None,
-                "message": f"Unexpected error: {e}",
-            }
+    try:
+        data = list(get_data_from_payload(resource_id, payload))
+
+        if cache_key is not None:
+            with _cache_lock:
+                _query_cache[cache_key] = data
+
+        return {
+            "success": True,
+            "data": data,
+            "message": "",
+        }
+
+    except DSLQueryError as e:
+        return {
+            "success": False,
+            "data": None,
+            "message": str(e),
+        }
+    except Exception as e:
+        log.error(f"Unexpected error in query_data for resource {resource_id}: {e}")
+        return {
+            "success": False,
+            "data": None,
+            "message": f"Unexpected error: {e}",
+        }
 
 
 def _field_ref(field: Dict[str, Any], as_measure: bool = False) -> Dict[str, Any]:
@@ -605,8 +1089,37 @@ def build_default_charts(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return charts
 
 
-# Global service instance
-_dsl_service = DSLService()
+def _check_resource_access(
+    context: Dict[str, Any], resource_id: str
+) -> None:
+    """Authorize ``resource_show`` for this user, with a short positive cache.
+
+    A hit in the per-process cache (or a repeat check within the same
+    request context) skips the auth pipeline — and the Postgres fetch it
+    implies — entirely. ``tk.NotAuthorized`` propagates unchanged on the
+    cold path, and denials are never cached.
+    """
+    authorized = context.setdefault("_gwexplorer_authorized", set())
+    if resource_id in authorized:
+        return
+
+    key = (context.get("user") or "", resource_id)
+    with _cache_lock:
+        allowed = _auth_cache.get(key)
+    if allowed is None:
+        tk.check_access("resource_show", context, {"id": resource_id})
+        with _cache_lock:
+            _auth_cache[key] = True
+    authorized.add(resource_id)
+
+
+def _valid_resource_id(value: Any) -> bool:
+    """True if ``value`` is a plausible resource identifier string.
+
+    Clients can post any JSON type as ``resourceID``; matching the regex
+    against a non-string would raise TypeError, so type-check first.
+    """
+    return isinstance(value, str) and _VALID_RESOURCE_ID.match(value) is not None
 
 
 @tk.side_effect_free
@@ -626,14 +1139,16 @@ def show_dsl_metadata(
     resource_id = data_dict.get("resourceID")
     if not resource_id:
         return tk.abort(400, "resourceID field is required")
-    
-    
-    tk.check_access("resource_show", context, {"id": resource_id})
+    if not _valid_resource_id(resource_id):
+        return tk.abort(400, "resourceID is not a valid resource identifier")
+
 
+    _check_resource_access(context, resource_id)
 
-    sort = data_dict.get("sort", "false").lower() == "true"
 
-    return _dsl_service.show_metadata(resource_id, sort)
+    sort = data_dict.get("sort") in _SORT_TRUE_VALUES
+
+    return show_metadata(resource_id, sort)
 
 
 def dsl_query_data(
@@ -652,11 +1167,15 @@ def dsl_query_data(
 
 
     resource_id = data_dict.get("resourceID")
-    tk.check_access("resource_show", context, {"id": resource_id})
+    if resource_id and not _valid_resource_id(resource_id):
+        return _create_error_response(
+            "resourceID", "invalid resource identifier"
+        )
+    _check_resource_access(context, resource_id)
 
     payload = data_dict.get("payload")
 
-    return _dsl_service.query_data(resource_id, payload)
+    return query_data(resource_id, payload)
 
 
 def gwexplorer_default_spec(
@@ -679,11 +1198,13 @@ def gwexplorer_default_spec(
     resource_id = data_dict.get("resourceID")
     if not resource_id:
         return tk.abort(400, "resourceID field is required")
+    if not _valid_resource_id(resource_id):
+        return tk.abort(400, "resourceID is not a valid resource identifier")
 
-    tk.check_access("resource_show", context, {"id": resource_id})
+    _check_resource_access(context, resource_id)
 
     try:
-        fields = _dsl_service.get_table_metadata(resource_id, sort=False)
+        fields = get_table_metadata(resource_id, sort=False)
         return {
             "success": True,
             "spec": build_default_charts(fields),
@@ -698,3 +1219,42 @@ def gwexplorer_default_spec(
             "resource_id": resource_id,
             "message": f"Error building default spec: {e}",
         }
+
+
+def _invalidate_after_datastore_write(
+    result: Any, data_dict: Dict[str, Any]
+) -> None:
+    """Evict a resource's cached state after a datastore write action ran."""
+    resource_id = None
+    if isinstance(result, dict):
+        resource_id = result.get("resource_id")
+    resource_id = resource_id or data_dict.get("resource_id")
+    if resource_id:
+        invalidate_resource(resource_id)
+
+
+# Datastore writes (API uploads, xloader/datapusher pushes) don't go
+# through the IResourceController hooks, so chain the write actions and
+# evict after each one. Registered only when the datastore plugin is
+# loaded (see GwexplorerPlugin.get_actions); CKAN requires gwexplorer to
+# come after datastore in ``ckan.plugins`` for the chain to resolve.
+
+@tk.chained_action
+def datastore_create(original_action, context, data_dict):
+    result = original_action(context, data_dict)
+    _invalidate_after_datastore_write(result, data_dict)
+    return result
+
+
+@tk.chained_action
+def datastore_upsert(original_action, context, data_dict):
+    result = original_action(context, data_dict)
+    _invalidate_after_datastore_write(result, data_dict)
+    return result
+
+
+@tk.chained_action
+def datastore_delete(original_action, context, data_dict):
+    result = original_action(context, data_dict)
+    _invalidate_after_datastore_write(result, data_dict)
+    return result
@@ -5,12 +5,17 @@ import ckanext.gwexplorer.validators as validators
 
 ignore_empty = tk.get_validator("ignore_empty")
 
+# File formats the explorer can read without a datastore table. can_view
+# runs once per resource on listing pages, so keep the check allocation-free.
+_SUPPORTED_FORMATS = frozenset({"csv", "xls", "xlsx", "tsv"})
+
 
 class GwexplorerPlugin(plugins.SingletonPlugin):
     plugins.implements(plugins.IConfigurer)
     plugins.implements(plugins.IActions)
     plugins.implements(plugins.IValidators)
     plugins.implements(plugins.IResourceView, inherit=True)
+    plugins.implements(plugins.IResourceController, inherit=True)
 
     # IConfigurer
     def update_config(self, config_):
@@ -20,11 +25,24 @@ class GwexplorerPlugin(plugins.SingletonPlugin):
 
     # IActions
     def get_actions(self):
-        return {
+        action_functions = {
             "show_dsl_metadata": actions.show_dsl_metadata,
             "dsl_query_data": actions.dsl_query_data,
             "gwexplorer_default_spec": actions.gwexplorer_default_spec,
         }
+        # Chain the datastore write actions so uploads that bypass the
+        # IResourceController hooks (API pushes, xloader) still evict our
+        # caches. The view works without the datastore plugin, so only
+        # chain when it is loaded.
+        if plugins.plugin_loaded("datastore"):
+            action_functions.update(
+                {
+                    "datastore_create": actions.datastore_create,
+                    "datastore_upsert": actions.datastore_upsert,
+                    "datastore_delete": actions.datastore_delete,
+                }
+            )
+        return action_functions
 
     # IValidators
     def get_validators(self):
@@ -32,17 +50,25 @@ class GwexplorerPlugin(plugins.SingletonPlugin):
             "gwexplorer_valid_spec": validators.gwexplorer_valid_spec,
         }
 
+    # IResourceController
+    #
+    # The DSL service caches per-resource parsers; evict them whenever a
+    # resource changes so a schema change (e.g. a datastore re-upload) is
+    # picked up on the next request.
+    def after_resource_update(self, context, resource):
+        actions.invalidate_resource(resource["id"])
+
+    def before_resource_delete(self, context, resource, resources):
+        actions.invalidate_resource(resource["id"])
+
     def can_view(self, data_dict):
         resource = data_dict['resource']
         if (resource.get('datastore_active') or
                 '_datastore_only_resource' in resource.get('url', '')):
             return True
-        resource_format = resource.get('format', None)
-        if resource_format:
-            return resource_format.lower() in ['csv', 'xls', 'xlsx', 'tsv']
-        else:
-            return False
-        
+        fmt = (resource.get('format') or '').lower()
+        return fmt in _SUPPORTED_FORMATS
+
 
     def info(self):
         return {
@@ -1,8 +1,15 @@
-"""Unit tests for the default-spec heuristic in actions.py.
+"""Unit tests for the pure helpers in actions.py.
 
-These exercise the pure ``build_default_charts`` helper directly, so they need
+These exercise the default-spec heuristic, the field-descriptor fast path,
+the JSON normalization helpers and the cache plumbing directly, so they need
 no database, Solr, or running CKAN app.
 """
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
 import ckanext.gwexplorer.actions as actions
 
 
@@ -111,3 +118,201 @@ def test_palette_contains_all_fields():
     palette_dims = {f["fid"] for f in charts[0]["encodings"]["dimensions"]}
     assert palette_measures == {"lat", "lon", "pop"}
     assert palette_dims == {"city"}
+
+
+# --- _raw_field_from_column -------------------------------------------------
+#
+# The information_schema fast path must keep producing the same descriptors
+# pygwalker's parser would infer, or the two metadata paths drift apart.
+
+@pytest.mark.parametrize(
+    "name,data_type,semantic,analytic",
+    [
+        # Geographic names win over the column type.
+        ("latitude", "text", "quantitative", "dimension"),
+        ("longitude", "double precision", "quantitative", "dimension"),
+        ("lat", "numeric", "quantitative", "dimension"),
+        ("lon", "real", "quantitative", "dimension"),
+        ("long", "text", "quantitative", "dimension"),
+        # pygwalker normalises case and trailing dots/spaces before matching.
+        ("Lat", "text", "quantitative", "dimension"),
+        ("LONGITUDE.", "text", "quantitative", "dimension"),
+        ("lat ", "text", "quantitative", "dimension"),
+        # Numeric types become measures (infer_number_to_dimension=False).
+        ("count", "smallint", "quantitative", "measure"),
+        ("count", "integer", "quantitative", "measure"),
+        ("count", "bigint", "quantitative", "measure"),
+        ("price", "decimal", "quantitative", "measure"),
+        ("price", "numeric", "quantitative", "measure"),
+        ("ratio", "real", "quantitative", "measure"),
+        ("ratio", "double precision", "quantitative", "measure"),
+        ("price", "money", "quantitative", "measure"),
+        # Temporal types are temporal dimensions.
+        ("when", "date", "temporal", "dimension"),
+        ("when", "timestamp without time zone", "temporal", "dimension"),
+        ("when", "timestamp with time zone", "temporal", "dimension"),
+        ("when", "time without time zone", "temporal", "dimension"),
+        ("when", "time with time zone", "temporal", "dimension"),
+        # Everything else falls back to a nominal dimension.
+        ("city", "text", "nominal", "dimension"),
+        ("flag", "boolean", "nominal", "dimension"),
+        ("blob", "jsonb", "nominal", "dimension"),
+    ],
+)
+def test_raw_field_from_column(name, data_type, semantic, analytic):
+    field = actions._raw_field_from_column(name, data_type)
+    assert field == {
+        "fid": name,
+        "name": name,
+        "semanticType": semantic,
+        "analyticType": analytic,
+    }
+
+
+# --- _orjson_default / _json_safe_rows --------------------------------------
+
+
+def test_orjson_default_naive_datetime_is_epoch_ms():
+    assert actions._orjson_default(datetime(1970, 1, 1)) == 0
+    assert actions._orjson_default(datetime(1970, 1, 1, 0, 0, 1)) == 1000
+
+
+def test_orjson_default_aware_datetime_is_epoch_ms():
+    dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert actions._orjson_default(dt) == int(dt.timestamp() * 1000)
+
+
+def test_orjson_default_matches_dataframe_encoder_for_decimal():
+    assert actions._orjson_default(Decimal("1.5")) == 1.5
+    assert actions._orjson_default(Decimal("NaN")) is None
+
+
+def test_json_safe_rows_nan_becomes_null():
+    rows = actions._json_safe_rows([{"a": float("nan"), "b": np.nan}])
+    assert rows == [{"a": None, "b": None}]
+
+
+def test_json_safe_rows_numpy_scalars_become_native():
+    rows = actions._json_safe_rows([{"i": np.int64(7), "f": np.float64(2.5)}])
+    assert rows == [{"i": 7, "f": 2.5}]
+
+
+def test_json_safe_rows_datetime_stays_epoch_ms():
+    # Datetimes must keep the epoch-millisecond representation
+    # DataFrameEncoder has always produced, not orjson's RFC 3339 strings.
+    rows = actions._json_safe_rows([{"ts": datetime(1970, 1, 2)}])
+    assert rows == [{"ts": 86400000}]
+
+
+def test_json_safe_rows_passes_plain_values_through():
+    row = {"s": "text", "i": 3, "f": 1.25, "n": None, "b": True}
+    assert actions._json_safe_rows([row]) == [row]
+
+
+# --- sort flag parsing ------------------------------------------------------
+
+
+@pytest.mark.parametrize("value", [True, "true", "True", "TRUE", "1", 1])
+def test_sort_flag_truthy_spellings(value):
+    assert value in actions._SORT_TRUE_VALUES
+
+
+@pytest.mark.parametrize("value", [False, None, "", "false", "yes", "0", 0])
+def test_sort_flag_other_values_rejected(value):
+    assert value not in actions._SORT_TRUE_VALUES
+
+
+# --- resource id validation -------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("9f1c2b3a-4d5e-6789-abcd-ef0123456789", True),
+        ("table_name-1", True),
+        ("", False),
+        ("bad id", False),
+        ("a; drop table x", False),
+        # Non-string JSON values must be rejected, not raise TypeError.
+        (42, False),
+        (None, False),
+        (["id"], False),
+    ],
+)
+def test_valid_resource_id(value, expected):
+    assert actions._valid_resource_id(value) is expected
+
+
+# --- get_table_metadata -----------------------------------------------------
+
+
+def test_get_table_metadata_filters_renames_and_sorts(monkeypatch):
+    raw = [
+        {"fid": "_id", "name": "_id", "semanticType": "quantitative",
+         "analyticType": "measure"},
+        {"fid": "zeta", "name": "zeta", "semanticType": "nominal",
+         "analyticType": "dimension"},
+        {"fid": "alpha", "name": "alpha", "semanticType": "quantitative",
+         "analyticType": "measure"},
+    ]
+    monkeypatch.setattr(actions, "_get_raw_fields", lambda table: raw)
+    monkeypatch.setattr(
+        actions, "_get_name_title_map", lambda table: {"zeta": "Amount"}
+    )
+
+    fields = actions.get_table_metadata("res-meta-1", sort=True)
+
+    # _id is excluded, labels applied with fid fallback, sorted by name.
+    assert [f["fid"] for f in fields] == ["alpha", "zeta"]
+    assert [f["name"] for f in fields] == ["alpha", "Amount"]
+    # The source descriptors (cached on the parser) stay untouched.
+    assert raw[1]["name"] == "zeta"
+
+
+def test_get_table_metadata_propagates_and_caches_failure(monkeypatch):
+    calls = []
+
+    def _boom(table):
+        calls.append(table)
+        raise RuntimeError("backend down")
+
+    monkeypatch.setattr(actions, "_get_raw_fields", _boom)
+    monkeypatch.setattr(actions, "_get_name_title_map", lambda table: {})
+
+    with pytest.raises(RuntimeError):
+        actions.get_table_metadata("res-meta-2")
+    assert calls == ["res-meta-2"]
+
+    # The burst that follows fails fast from the failure cache, without
+    # touching the backend again.
+    with pytest.raises(actions.DatabaseConnectionError, match="backend down"):
+        actions.get_table_metadata("res-meta-2")
+    assert calls == ["res-meta-2"]
+
+    actions.invalidate_resource("res-meta-2")
+
+
+# --- invalidate_resource ----------------------------------------------------
+
+
+def test_invalidate_resource_evicts_all_caches():
+    rid, other = "res-evict-1", "res-evict-2"
+    actions._parser_cache[rid] = object()
+    actions._name_title_cache[rid] = {"a": "A"}
+    actions._metadata_cache[(rid, False)] = {"success": True}
+    actions._metadata_cache[(rid, True)] = {"success": True}
+    actions._query_cache[(rid, b"{}")] = [{"a": 1}]
+    actions._query_cache[(other, b"{}")] = [{"a": 2}]
+    actions._failure_cache[rid] = "boom"
+
+    actions.invalidate_resource(rid)
+
+    assert rid not in actions._parser_cache
+    assert rid not in actions._name_title_cache
+    assert (rid, False) not in actions._metadata_cache
+    assert (rid, True) not in actions._metadata_cache
+    assert (rid, b"{}") not in actions._query_cache
+    assert rid not in actions._failure_cache
+    # Other resources keep their entries.
+    assert (other, b"{}") in actions._query_cache
+    actions.invalidate_resource(other)
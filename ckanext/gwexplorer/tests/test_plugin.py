@@ -58,3 +58,31 @@ import ckanext.gwexplorer.plugin as plugin  # noqa: F401
 @pytest.mark.usefixtures("with_plugins")
 def test_plugin():
     assert plugin_loaded("gwexplorer")
+
+
+# --- can_view ---------------------------------------------------------------
+#
+# can_view only inspects the resource dict, so it can run against a bare
+# plugin instance without a configured app.
+
+def _can_view(resource):
+    return plugin.GwexplorerPlugin().can_view({"resource": resource})
+
+
+def test_can_view_datastore_resource():
+    assert _can_view({"datastore_active": True, "url": ""}) is True
+
+
+def test_can_view_datastore_only_resource_url():
+    assert _can_view({"url": "/datastore/dump/_datastore_only_resource"}) is True
+
+
+@pytest.mark.parametrize("fmt", ["csv", "CSV", "xls", "XLSX", "tsv"])
+def test_can_view_supported_file_formats(fmt):
+    assert _can_view({"url": "http://example.com/f", "format": fmt}) is True
+
+
+@pytest.mark.parametrize("fmt", ["pdf", "json", "shp", "", None])
+def test_can_view_rejects_other_formats(fmt):
+    resource = {"url": "http://example.com/f", "format": fmt}
+    assert _can_view(resource) is False